@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""Loreline Python API checks.
+
+py/test-runner.py drives the generated runtime directly, so it never runs
+the public wrapper in loreline/__init__.py. These checks play a few test
+fixtures through ``loreline.Loreline`` instead and verify what the wrapper
+adds on top of the runtime:
+  - Handlers and play()/resume() share one Interpreter instance
+  - Wrapped tags and choice options are tuples matching the raw objects
+  - Batched character field accessors agree with the single-field ones
+  - The opt-in parse cache and clear_parse_cache()
+"""
+
+import os
+import sys
+import traceback
+
+# Ensure the py/ package is importable when run from the repo root
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from loreline import ChoiceOption, Interpreter, Loreline, TextTag  # noqa: E402
+
+_PASS = "\033[32mPASS\033[0m"
+_FAIL = "\033[31mFAIL\033[0m"
+
+
+def read_fixture(test_dir, name):
+    """Read a test fixture with LF line endings."""
+    with open(os.path.join(test_dir, name), encoding="utf-8") as f:
+        return f.read().replace("\r\n", "\n")
+
+
+def play_through(script, raw=False, on_dialogue=None, choices=()):
+    """Play ``script`` to the end, selecting ``choices`` in order.
+
+    Returns ``(returned, seen, dialogues, menus)``: the Interpreter returned
+    by play(), every Interpreter passed to a handler, the ``(character,
+    text, tags)`` of each dialogue, and the options of each choice.
+    """
+    seen = []
+    dialogues = []
+    menus = []
+    pending = list(choices)
+
+    def handle_dialogue(interp, character, text, tags, advance):
+        seen.append(interp)
+        dialogues.append((character, text, tags))
+        if on_dialogue is not None:
+            on_dialogue(interp, len(dialogues) - 1)
+        advance()
+
+    def handle_choice(interp, options, select):
+        seen.append(interp)
+        menus.append(options)
+        select(pending.pop(0) if pending else 0)
+
+    def handle_finish(interp):
+        seen.append(interp)
+
+    returned = Loreline.play(script, handle_dialogue, handle_choice, handle_finish, raw=raw)
+    return returned, seen, dialogues, menus
+
+
+def check_play_identity(test_dir):
+    script = Loreline.parse(read_fixture(test_dir, "Tags-Formatting.lor"))
+    for raw in (False, True):
+        returned, seen, _, _ = play_through(script, raw=raw)
+        assert isinstance(returned, Interpreter)
+        assert seen, "no handler was called"
+        assert all(interp is returned for interp in seen), f"raw={raw}: handlers got another Interpreter"
+
+
+def check_resume_identity(test_dir):
+    script = Loreline.parse(read_fixture(test_dir, "SaveRestore-CharacterProps.lor"))
+    saved = []
+
+    def handle_choice(interp, options, select):
+        saved.append(interp.save())
+
+    Loreline.play(script, lambda i, c, t, tags, advance: advance(), handle_choice, lambda i: None)
+    assert saved, "the script did not reach its choice"
+
+    seen = []
+
+    def handle_dialogue(interp, character, text, tags, advance):
+        seen.append(interp)
+        advance()
+
+    def handle_choice_resumed(interp, options, select):
+        seen.append(interp)
+        select(0)
+
+    returned = Loreline.resume(script, handle_dialogue, handle_choice_resumed, seen.append, saved[0])
+    assert seen, "no handler was called"
+    assert all(interp is returned for interp in seen), "handlers got another Interpreter"
+
+
+def check_tags(test_dir):
+    script = Loreline.parse(read_fixture(test_dir, "Tags-Formatting.lor"))
+    _, _, wrapped, _ = play_through(script)
+    _, _, raw, _ = play_through(script, raw=True)
+    assert len(wrapped) == len(raw)
+    assert any(tags for _, _, tags in wrapped), "fixture has no tagged line"
+    assert any(not tags for _, _, tags in wrapped), "fixture has no untagged line"
+    for (_, text, tags), (_, raw_text, raw_tags) in zip(wrapped, raw):
+        assert text == raw_text
+        assert type(tags) is tuple, f"tags are a {type(tags).__name__}"
+        assert all(type(tag) is TextTag for tag in tags)
+        expected = [(t.value, t.offset, t.closing) for t in (raw_tags or [])]
+        assert [tuple(tag) for tag in tags] == expected, f"{text!r}: {tags!r} != {expected!r}"
+
+
+def check_choice_options(test_dir):
+    script = Loreline.parse(read_fixture(test_dir, "SaveRestore-CharacterProps.lor"))
+    _, _, _, wrapped = play_through(script)
+    _, _, _, raw = play_through(script, raw=True)
+    assert wrapped, "the script did not reach its choice"
+    for options, raw_options in zip(wrapped, raw):
+        assert len(options) == len(raw_options)
+        for option, raw_option in zip(options, raw_options):
+            assert type(option) is ChoiceOption
+            assert type(option.tags) is tuple
+            assert (option.text, option.enabled) == (raw_option.text, raw_option.enabled)
+            assert len(option.tags) == len(raw_option.tags or [])
+
+
+def check_character_fields(test_dir):
+    script = Loreline.parse(read_fixture(test_dir, "Characters-MultipleProperties.lor"))
+    fields = ["name", "health", "alive", "weapon", "companion"]
+    results = {}
+
+    # Record inside the handler and assert afterwards, so that a failure is
+    # not reported through the runtime's own error handling
+    def on_dialogue(interp, index):
+        if index != 0:
+            return
+        results["batch"] = interp.get_character_fields("hero", fields)
+        results["single"] = [interp.get_character_field("hero", field) for field in fields]
+
+        interp.set_character_fields("hero", {"health": 42, "weapon": "axe"})
+        results["set_batch"] = [interp.get_character_field("hero", "health"), interp.get_character_field("hero", "weapon")]
+
+        interp.set_character_field("hero", "companion", "Owl")
+        results["set_single"] = interp.get_character_fields("hero", ["companion", "health"])
+
+    play_through(script, on_dialogue=on_dialogue)
+    assert results, "no dialogue was played"
+    assert results["batch"] == results["single"], f"{results['batch']!r} != {results['single']!r}"
+    assert results["set_batch"] == [42, "axe"], results["set_batch"]
+    assert results["set_single"] == ["Owl", 42], results["set_single"]
+
+
+def check_parse_cache(test_dir):
+    source = read_fixture(test_dir, "Tags-Formatting.lor")
+    assert Loreline.parse(source) is not Loreline.parse(source), "parse() cached without cache=True"
+    cached = Loreline.parse(source, cache=True)
+    assert Loreline.parse(source, cache=True) is cached
+    assert Loreline.parse(source) is not cached
+    Loreline.clear_parse_cache()
+    fresh = Loreline.parse(source, cache=True)
+    assert fresh is not cached, "clear_parse_cache() kept the cached script"
+    assert Loreline.print(fresh) == Loreline.print(cached)
+
+
+CHECKS = [
+    check_play_identity,
+    check_resume_identity,
+    check_tags,
+    check_choice_options,
+    check_character_fields,
+    check_parse_cache,
+]
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python3 py/api-test.py <test-directory>", file=sys.stderr)
+        sys.exit(1)
+    test_dir = sys.argv[1]
+
+    fail_count = 0
+    for check in CHECKS:
+        name = check.__name__[len("check_"):]
+        try:
+            check(test_dir)
+        except Exception:
+            fail_count += 1
+            sys.stdout.write(f"{_FAIL} - {name}\n")
+            sys.stdout.write(traceback.format_exc())
+        else:
+            sys.stdout.write(f"{_PASS} - {name}\n")
+
+    print()
+    if fail_count == 0:
+        print(f"\033[1m\033[32m  All {len(CHECKS)} API checks passed\033[0m")
+    else:
+        print(f"\033[1m\033[31m  {fail_count} of {len(CHECKS)} API checks failed\033[0m")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,16 +2,40 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Callable, List, Optional
+import sys
+from functools import lru_cache
+from importlib import import_module
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
 
-from . import _core
+
+_core_module: Any = None
+"""The generated runtime module, once ``_get_core()`` has imported it."""
+
+
+def _get_core() -> Any:
+    """Return the generated runtime module, importing it on first use."""
+    global _core_module
+    core = _core_module
+    if core is None:
+        # Not ``from . import _core``: its fromlist check would call the
+        # module-level __getattr__ below before _core is imported. Threads
+        # racing here wait on the import lock and get the same module.
+        core = _core_module = import_module(__name__ + "._core")
+    return core
+
+
+def __getattr__(name: str) -> Any:
+    # The generated runtime is large; it is only imported once something
+    # needs it, so that importing the public types stays cheap.
+    if name == "_core":
+        return _get_core()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ── Types ────────────────────────────────────────────────────────────────
 
-@dataclass
-class TextTag:
+class TextTag(NamedTuple):
     """A tag embedded in text content, used for styling or other purposes."""
 
     value: str
@@ -24,15 +48,14 @@ class TextTag:
     """Whether this is a closing tag."""
 
 
-@dataclass
-class ChoiceOption:
+class ChoiceOption(NamedTuple):
     """A choice option presented to the user."""
 
     text: str
     """The text of the choice option."""
 
-    tags: List[TextTag]
-    """Any tags associated with the choice text."""
+    tags: Sequence[TextTag]
+    """A tuple of the tags associated with the choice text."""
 
     enabled: bool
     """Whether this choice option is currently enabled."""
@@ -40,14 +63,14 @@ class ChoiceOption:
 
 # ── Type aliases for callbacks ───────────────────────────────────────────
 
-DialogueHandler = Callable[["Interpreter", Optional[str], str, List[TextTag], Callable[[], None]], None]
+DialogueHandler = Callable[["Interpreter", Optional[str], str, Sequence[TextTag], Callable[[], None]], None]
 """Called when dialogue text should be displayed.
 
 Args:
     interpreter: The interpreter instance.
     character: The character speaking (None for narrator text).
     text: The text content to display.
-    tags: Any tags in the text.
+    tags: A tuple of the tags in the text.
     advance: Function to call when the text has been displayed.
 """
 
@@ -78,52 +101,183 @@ Args:
 
 # ── Internal helpers ─────────────────────────────────────────────────────
 
-def _wrap_tag(tag: _core.loreline_TextTag) -> TextTag:
-    """Convert an internal TextTag to the public type."""
-    return TextTag(value=tag.value, offset=tag.offset, closing=tag.closing)
+_TAG_FIELDS = attrgetter("value", "offset", "closing")
+"""Read the fields of an internal TextTag in ``TextTag`` field order."""
 
+_OPTION_FIELDS = attrgetter("text", "tags", "enabled")
+"""Read the fields of an internal ChoiceOption in ``ChoiceOption`` field order."""
 
-def _wrap_tags(tags: list) -> List[TextTag]:
-    """Convert a list of internal TextTags to public types."""
-    if tags is None:
-        return []
-    return [_wrap_tag(t) for t in tags]
+_EMPTY_TAGS: Sequence[TextTag] = ()
+"""Tags of untagged text, shared since tuples cannot be modified."""
 
+# The helpers and bridges below run for every dialogue line and choice.
+# Module globals they use are bound as underscore-prefixed default
+# arguments so they are read as fast locals; callers never pass them.
 
-def _wrap_option(opt: _core.loreline_ChoiceOption) -> ChoiceOption:
-    """Convert an internal ChoiceOption to the public type."""
-    return ChoiceOption(
-        text=opt.text,
-        tags=_wrap_tags(opt.tags),
-        enabled=opt.enabled,
-    )
+
+def _wrap_tags(
+    tags: list,
+    _make_tag=TextTag._make,
+    _fields=_TAG_FIELDS,
+    _empty=_EMPTY_TAGS,
+) -> Sequence[TextTag]:
+    """Convert a list of internal TextTags to a tuple of public types."""
+    if not tags:
+        return _empty
+    return tuple(map(_make_tag, map(_fields, tags)))
 
 
-def _make_dialogue_bridge(handle_dialogue: DialogueHandler) -> Callable:
+def _wrap_options(
+    options: list,
+    _ChoiceOption=ChoiceOption,
+    _fields=_OPTION_FIELDS,
+    _wrap_tags=_wrap_tags,
+    _empty=_EMPTY_TAGS,
+) -> List[ChoiceOption]:
+    """Convert a list of internal ChoiceOptions to public types."""
+    return [
+        _ChoiceOption(text, _wrap_tags(tags) if tags else _empty, enabled)
+        for text, tags, enabled in map(_fields, options)
+    ]
+
+
+def _make_dialogue_bridge(handle_dialogue: DialogueHandler, cached: list) -> Callable:
     """Wrap a public DialogueHandler to bridge internal types."""
-    def bridge(interp, character, text, tags, advance):
-        wrapper = Interpreter(interp)
-        handle_dialogue(wrapper, character, text, _wrap_tags(tags), advance)
+    def bridge(
+        interp, character, text, tags, advance,
+        _Interpreter=Interpreter,
+        _make_tag=TextTag._make,
+        _fields=_TAG_FIELDS,
+        _empty=_EMPTY_TAGS,
+        _intern=sys.intern,
+    ):
+        wrapper = cached[0]
+        if wrapper is None or wrapper._internal is not interp:
+            wrapper = cached[0] = _Interpreter(interp)
+        if character is not None:
+            character = _intern(character)
+        if tags:
+            tags = tuple(map(_make_tag, map(_fields, tags)))
+        else:
+            tags = _empty
+        handle_dialogue(wrapper, character, text, tags, advance)
     return bridge
 
 
-def _make_choice_bridge(handle_choice: ChoiceHandler) -> Callable:
+def _make_choice_bridge(handle_choice: ChoiceHandler, cached: list) -> Callable:
     """Wrap a public ChoiceHandler to bridge internal types."""
-    def bridge(interp, options, select):
-        wrapper = Interpreter(interp)
-        wrapped_options = [_wrap_option(o) for o in options]
+    def bridge(interp, options, select, _Interpreter=Interpreter, _wrap_options=_wrap_options):
+        wrapper = cached[0]
+        if wrapper is None or wrapper._internal is not interp:
+            wrapper = cached[0] = _Interpreter(interp)
+        # The core builds new option objects (and tag lists) each time a
+        # choice is presented, so there is no stable identity to memoize on.
+        wrapped_options = _wrap_options(options)
         handle_choice(wrapper, wrapped_options, select)
     return bridge
 
 
-def _make_finish_bridge(handle_finish: FinishHandler) -> Callable:
+def _make_raw_dialogue_bridge(handle_dialogue: DialogueHandler, cached: list) -> Callable:
+    """Wrap a DialogueHandler, passing the internal tags through unchanged."""
+    def bridge(interp, character, text, tags, advance, _Interpreter=Interpreter):
+        wrapper = cached[0]
+        if wrapper is None or wrapper._internal is not interp:
+            wrapper = cached[0] = _Interpreter(interp)
+        handle_dialogue(wrapper, character, text, tags, advance)
+    return bridge
+
+
+def _make_raw_choice_bridge(handle_choice: ChoiceHandler, cached: list) -> Callable:
+    """Wrap a ChoiceHandler, passing the internal options through unchanged."""
+    def bridge(interp, options, select, _Interpreter=Interpreter):
+        wrapper = cached[0]
+        if wrapper is None or wrapper._internal is not interp:
+            wrapper = cached[0] = _Interpreter(interp)
+        handle_choice(wrapper, options, select)
+    return bridge
+
+
+def _make_finish_bridge(handle_finish: FinishHandler, cached: list) -> Callable:
     """Wrap a public FinishHandler to bridge internal types."""
-    def bridge(interp):
-        wrapper = Interpreter(interp)
+    def bridge(interp, _Interpreter=Interpreter):
+        wrapper = cached[0]
+        if wrapper is None or wrapper._internal is not interp:
+            wrapper = cached[0] = _Interpreter(interp)
         handle_finish(wrapper)
     return bridge
 
 
+def _build_bridges(
+    handle_dialogue: DialogueHandler,
+    handle_choice: ChoiceHandler,
+    handle_finish: FinishHandler,
+    raw: bool = False,
+) -> tuple:
+    """Return the ``(dialogue, choice, finish, cached)`` bridges for public handlers.
+
+    ``cached`` is a one-item list holding the Interpreter wrapper shared by
+    the three bridges and returned by ``play()``/``resume()`` (see
+    ``_wrap_interpreter``), so handlers and the caller always see the same
+    instance. Each ``play()`` or ``resume()`` call gets its own bridges:
+    nothing here outlives the internal interpreter that holds them.
+    """
+    wrappers: List[Any] = [None]
+    if raw:
+        return (
+            _make_raw_dialogue_bridge(handle_dialogue, wrappers),
+            _make_raw_choice_bridge(handle_choice, wrappers),
+            _make_finish_bridge(handle_finish, wrappers),
+            wrappers,
+        )
+    return (
+        _make_dialogue_bridge(handle_dialogue, wrappers),
+        _make_choice_bridge(handle_choice, wrappers),
+        _make_finish_bridge(handle_finish, wrappers),
+        wrappers,
+    )
+
+
+def _wrap_interpreter(cached: list, internal: Any) -> "Interpreter":
+    """Return the public wrapper for ``internal``, reusing the cached one."""
+    wrapper = cached[0]
+    if wrapper is None or wrapper._internal is not internal:
+        wrapper = cached[0] = Interpreter(internal)
+    return wrapper
+
+
+_default_options: List[Any] = [None]
+"""Shared default options, built on first use; the interpreter only reads them."""
+
+
+def _build_options(functions: Optional[dict], strict_access: bool, translations: Any) -> Any:
+    """Build the internal options object passed to ``play()``/``resume()``."""
+    if functions is None and not strict_access and translations is None:
+        options = _default_options[0]
+        if options is None:
+            options = _default_options[0] = _get_core()._hx_AnonObject({
+                "functions": None,
+                "strictAccess": False,
+                "translations": None,
+            })
+        return options
+    return _get_core()._hx_AnonObject({
+        "functions": functions,
+        "strictAccess": strict_access,
+        "translations": translations,
+    })
+
+
+@lru_cache(maxsize=16)
+def _parse_source(source: str, file_path: Optional[str]) -> "Script":
+    """Parse a script without imports, keeping recent results.
+
+    The result only depends on ``source`` and ``file_path``, so repeated
+    ``Loreline.parse(..., cache=True)`` calls reuse the Script. See
+    ``Loreline.clear_parse_cache()``.
+    """
+    return Script(_get_core().loreline_Loreline.parse(source, file_path, None, None))
+
+
 # ── Node ─────────────────────────────────────────────────────────────────
 
 class Node:
@@ -132,6 +286,8 @@ class Node:
     Provides access to the node type, unique ID, and JSON export.
     """
 
+    __slots__ = ("_internal", "__weakref__")
+
     def __init__(self, _internal: Any) -> None:
         self._internal = _internal
 
@@ -173,7 +329,7 @@ class Node:
         Returns:
             A JSON string representation of the node tree.
         """
-        return _core.loreline_Json.stringify(self._internal.toJson(), pretty)
+        return _get_core().loreline_Json.stringify(self._internal.toJson(), pretty)
 
     @staticmethod
     def from_json(json_str: str) -> "Node":
@@ -185,8 +341,9 @@ class Node:
         Returns:
             The reconstructed Node.
         """
-        parsed = _core.loreline_Json.parse(json_str)
-        internal = _core.loreline_Node.fromJson(parsed)
+        core = _get_core()
+        parsed = core.loreline_Json.parse(json_str)
+        internal = core.loreline_Node.fromJson(parsed)
         return Node(internal)
 
 
@@ -199,6 +356,8 @@ class Script(Node):
     ``Loreline.resume()`` to execute.
     """
 
+    __slots__ = ()
+
     def __init__(self, _internal: Any) -> None:
         super().__init__(_internal)
 
@@ -212,8 +371,9 @@ class Script(Node):
         Returns:
             The reconstructed Script.
         """
-        parsed = _core.loreline_Json.parse(json_str)
-        internal = _core.loreline_Script.fromJson(parsed)
+        core = _get_core()
+        parsed = core.loreline_Json.parse(json_str)
+        internal = core.loreline_Script.fromJson(parsed)
         return Script(internal)
 
 
@@ -225,6 +385,8 @@ class Interpreter:
     Provides methods to save/restore state and access character data.
     """
 
+    __slots__ = ("_internal", "__weakref__")
+
     def __init__(self, _internal: Any) -> None:
         self._internal = _internal
 
@@ -290,6 +452,45 @@ class Interpreter:
         """
         self._internal.setCharacterField(character, field, value)
 
+    def get_character_fields(self, character: str, fields: List[str]) -> List[Any]:
+        """Get several fields of a character at once.
+
+        The character is looked up once for all fields, which is cheaper
+        than calling ``get_character_field()`` for each of them.
+
+        Args:
+            character: The character identifier.
+            fields: The field names to retrieve.
+
+        Returns:
+            The field values, in the same order as ``fields``. Each value is
+            None if the character or that field doesn't exist.
+        """
+        internal = self._internal
+        character_fields = internal.getCharacter(character)
+        if character_fields is None:
+            return [None] * len(fields)
+        get_field = _get_core().loreline_Objects.getField
+        return [get_field(internal, character_fields, field) for field in fields]
+
+    def set_character_fields(self, character: str, values: Dict[str, Any]) -> None:
+        """Set several fields of a character at once.
+
+        Args:
+            character: The character identifier.
+            values: A mapping of field names to the values to assign.
+        """
+        internal = self._internal
+        character_fields = internal.getCharacter(character)
+        if character_fields is None:
+            # Let the runtime report the unknown character as it usually does
+            for field, value in values.items():
+                internal.setCharacterField(character, field, value)
+            return
+        set_field = _get_core().loreline_Objects.setField
+        for field, value in values.items():
+            set_field(internal, character_fields, field, value)
+
     def get_state_field(self, name: str) -> Any:
         """Get a state field by name, resolving from the current scope outward.
 
@@ -360,6 +561,7 @@ class Loreline:
         file_path: Optional[str] = None,
         handle_file: Optional[ImportsFileHandler] = None,
         callback: Optional[Callable[[Script], None]] = None,
+        cache: bool = False,
     ) -> Optional[Script]:
         """Parse a Loreline script string into a Script AST.
 
@@ -370,25 +572,44 @@ class Loreline:
             handle_file: Optional handler to load imported files.
             callback: Optional callback receiving the parsed Script.
                       Useful when ``handle_file`` resolves asynchronously.
+            cache: If True, keep the most recent parsed scripts and reuse
+                   them for the same ``source`` and ``file_path``. Ignored
+                   when ``handle_file`` or ``callback`` is given.
 
         Returns:
             The parsed Script, or None if loaded asynchronously.
+            With ``cache``, parsing the same source again returns the
+            *same* Script instance, not a copy, and leaves ``last_error()``
+            untouched. Use ``clear_parse_cache()`` to release the cached
+            scripts.
 
         Raises:
             Exception: If the script contains syntax errors.
         """
+        if cache and handle_file is None and callback is None:
+            return _parse_source(source, file_path)
+
         wrapped_callback = None
         if callback is not None:
             def wrapped_callback(internal_script):
                 callback(Script(internal_script))
 
-        result = _core.loreline_Loreline.parse(
+        result = _get_core().loreline_Loreline.parse(
             source, file_path, handle_file, wrapped_callback,
         )
         if result is not None:
             return Script(result)
         return None
 
+    @staticmethod
+    def clear_parse_cache() -> None:
+        """Drop the scripts cached by ``parse(..., cache=True)``.
+
+        Later cached calls parse their source again and return new Script
+        instances.
+        """
+        _parse_source.cache_clear()
+
     @staticmethod
     def play(
         script: Script,
@@ -399,6 +620,7 @@ class Loreline:
         functions: Optional[dict] = None,
         strict_access: bool = False,
         translations: Any = None,
+        raw: bool = False,
     ) -> Interpreter:
         """Start playing a parsed script.
 
@@ -411,25 +633,28 @@ class Loreline:
             functions: Optional dict of ``{name: callable}`` custom functions.
             strict_access: If True, accessing undefined variables raises an error.
             translations: Optional translations map from ``extract_translations()``.
+            raw: If True, handlers receive the runtime's own tag and choice
+                 option objects instead of ``TextTag``/``ChoiceOption``.
+                 They expose the same attributes but are not tuples and must
+                 not be modified. Intended for tooling; unstable.
 
         Returns:
             The running Interpreter instance.
         """
-        options = _core._hx_AnonObject({
-            "functions": functions,
-            "strictAccess": strict_access,
-            "translations": translations,
-        })
+        options = _build_options(functions, strict_access, translations)
+        dialogue_bridge, choice_bridge, finish_bridge, wrappers = _build_bridges(
+            handle_dialogue, handle_choice, handle_finish, raw,
+        )
 
-        internal = _core.loreline_Loreline.play(
+        internal = _get_core().loreline_Loreline.play(
             script._internal,
-            _make_dialogue_bridge(handle_dialogue),
-            _make_choice_bridge(handle_choice),
-            _make_finish_bridge(handle_finish),
+            dialogue_bridge,
+            choice_bridge,
+            finish_bridge,
             beat_name,
             options,
         )
-        return Interpreter(internal)
+        return _wrap_interpreter(wrappers, internal)
 
     @staticmethod
     def resume(
@@ -442,6 +667,7 @@ class Loreline:
         functions: Optional[dict] = None,
         strict_access: bool = False,
         translations: Any = None,
+        raw: bool = False,
     ) -> Interpreter:
         """Resume a script from saved state.
 
@@ -455,26 +681,29 @@ class Loreline:
             functions: Optional dict of custom functions.
             strict_access: If True, accessing undefined variables raises an error.
             translations: Optional translations map from ``extract_translations()``.
+            raw: If True, handlers receive the runtime's own tag and choice
+                 option objects instead of ``TextTag``/``ChoiceOption``.
+                 They expose the same attributes but are not tuples and must
+                 not be modified. Intended for tooling; unstable.
 
         Returns:
             The running Interpreter instance.
         """
-        options = _core._hx_AnonObject({
-            "functions": functions,
-            "strictAccess": strict_access,
-            "translations": translations,
-        })
+        options = _build_options(functions, strict_access, translations)
+        dialogue_bridge, choice_bridge, finish_bridge, wrappers = _build_bridges(
+            handle_dialogue, handle_choice, handle_finish, raw,
+        )
 
-        internal = _core.loreline_Loreline.resume(
+        internal = _get_core().loreline_Loreline.resume(
             script._internal,
-            _make_dialogue_bridge(handle_dialogue),
-            _make_choice_bridge(handle_choice),
-            _make_finish_bridge(handle_finish),
+            dialogue_bridge,
+            choice_bridge,
+            finish_bridge,
             save_data,
             beat_name,
             options,
         )
-        return Interpreter(internal)
+        return _wrap_interpreter(wrappers, internal)
 
     @staticmethod
     def extract_translations(script: Script) -> Any:
@@ -487,7 +716,7 @@ class Loreline:
             A translations object to pass as the ``translations`` argument
             to ``play()`` or ``resume()``.
         """
-        return _core.loreline_Loreline.extractTranslations(script._internal)
+        return _get_core().loreline_Loreline.extractTranslations(script._internal)
 
     @staticmethod
     def translation_format(name: str, enabled: bool) -> None:
@@ -498,7 +727,7 @@ class Loreline:
         ``"xliff"`` (.xliff, .xlf), ``"csv"`` (.csv, .tsv). Unknown names are
         accepted silently for forward compatibility.
         """
-        _core.loreline_Loreline.translationFormat(name, enabled)
+        _get_core().loreline_Loreline.translationFormat(name, enabled)
 
     @staticmethod
     def last_error() -> Optional[Any]:
@@ -512,7 +741,7 @@ class Loreline:
 
         Not thread-safe — read immediately after the call returns.
         """
-        return _core.loreline_Loreline.lastError()
+        return _get_core().loreline_Loreline.lastError()
 
     @staticmethod
     def load_locale(
@@ -542,7 +771,7 @@ class Loreline:
         Returns:
             The merged translations map (synchronously, when ``handle_file`` is sync).
         """
-        return _core.loreline_Loreline.loadLocale(
+        return _get_core().loreline_Loreline.loadLocale(
             locale, script._internal, file_path, handle_file, callback,
         )
 
@@ -558,7 +787,7 @@ class Loreline:
         Returns:
             The printed source code.
         """
-        return _core.loreline_Loreline.print(script._internal, indent, newline)
+        return _get_core().loreline_Loreline.print(script._internal, indent, newline)
 
     @staticmethod
     def update(delta: float) -> None:
@@ -570,4 +799,4 @@ class Loreline:
         Args:
             delta: Time elapsed since last frame in seconds.
         """
-        _core.loreline_Timer.update(delta)
+        _get_core().loreline_Timer.update(delta)
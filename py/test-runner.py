@@ -8,6 +8,10 @@ Follows the same test protocol as the JS, C#, and C++ test runners:
   - Runs roundtrip (parse -> print -> parse -> print) stability checks
   - Reports pass/fail counts
 
+Files run in parallel worker processes, one per CPU by default. Pass
+``-j JOBS`` (or set ``LORELINE_TEST_JOBS``) to change that; ``-j 1`` runs
+everything inline, e.g. under pdb.
+
 Note: ast-print is intentionally only run by the CLI test runner —
 AstPrinter is a pure Haxe debug pretty-printer with no target-specific
 behavior, so a single CLI run is enough to catch any missing node-type
@@ -15,95 +19,170 @@ case. That's why the CLI test count is higher than each per-target
 runner's count.
 """
 
+import argparse
+import itertools
 import os
 import re
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 
 # Ensure the py/ package is importable when run from the repo root
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from loreline._core import loreline_Loreline, loreline_Interpreter, loreline_Json, loreline_Script, _hx_AnonObject  # noqa: E402
 
-pass_count = 0
-fail_count = 0
-file_count = 0
-file_fail_count = 0
+_LOR_LANG_RE = re.compile(r"\.\w{2}\.lor$")
+_YAML_ITEM_RE = re.compile(r"^- (\w+):\s*(.*)")
+_YAML_CONT_RE = re.compile(r"^  (\w+):\s*(.*)")
+_INT_RE = re.compile(r"^-?\d+$")
+_TEST_BLOCK_RE = re.compile(r"<test>([\s\S]*?)</test>")
+
+# Result line prefixes/suffix: "PASS - <label>" / "FAIL - <label>"
+_PASS = "\033[1m\033[32mPASS\033[0m - \033[90m"
+_FAIL = "\033[1m\033[31mFAIL\033[0m - \033[90m"
+_END = "\033[0m\n"
 
 
 # ── Helpers ──────────────────────────────────────────────────────────────
 
-def collect_test_files(directory):
-    """Recursively collect .lor test files, skipping imports/ and modified/ dirs."""
-    files = []
-    for entry in sorted(os.listdir(directory)):
-        full_path = os.path.join(directory, entry)
-        if os.path.isdir(full_path):
-            if entry not in ("imports", "modified"):
-                files.extend(collect_test_files(full_path))
-        elif entry.endswith(".lor") and not re.search(r"\.\w{2}\.lor$", entry):
-            files.append(full_path)
-    return files
+def iter_test_files(directory):
+    """Recursively yield .lor test files, skipping imports/ and modified/ dirs.
+
+    Files of a directory are yielded (sorted by name) before those of its
+    subdirectories, so tests can start before the whole tree is walked.
+    """
+    for root, dirs, files in os.walk(directory, followlinks=True):
+        dirs[:] = sorted(d for d in dirs if d not in ("imports", "modified"))
+        for name in sorted(files):
+            if name.endswith(".lor") and not _LOR_LANG_RE.search(name):
+                yield os.path.join(root, name)
+
+
+def read_file(path):
+    """Read a UTF-8 file with raw os.read calls, bypassing the text I/O layer.
+
+    A single read sized from fstat is usually enough, but reads may return
+    fewer bytes than asked for, so keep reading until EOF.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = [os.read(fd, os.fstat(fd).st_size or 65536)]
+        while chunks[-1]:
+            chunks.append(os.read(fd, 65536))
+        return b"".join(chunks).decode("utf-8")
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=128)
+def read_import(path):
+    """Read an imported file; cached since the same imports are read by every parse."""
+    # Normalized to LF like text-mode reads, since imports are used as-is
+    return to_lf(read_file(path))
 
 
 def handle_file(path, callback):
     """File handler for imports."""
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            callback(f.read())
+        callback(read_import(os.path.abspath(path)))
     except Exception:
         callback(None)
 
 
+def to_lf(text):
+    """Convert CRLF line endings to LF, skipping the copy when there are none."""
+    return text.replace("\r\n", "\n") if "\r" in text else text
+
+
+def to_crlf(text):
+    """Convert line endings to CRLF."""
+    return to_lf(text).replace("\n", "\r\n")
+
+
+@lru_cache(maxsize=64)
+def load_aux(path, crlf):
+    """Read an auxiliary test file (e.g. a restore script), normalized for the mode."""
+    content = read_file(path)
+    return to_crlf(content) if crlf else to_lf(content)
+
+
+@lru_cache(maxsize=256)
+def parse_cached(content, file_path):
+    """Parse a script with imports, reusing the result for identical input.
+
+    The interpreter never mutates a parsed script, so every test item and
+    save/restore run of the same content can share one parse.
+    """
+    return loreline_Loreline.parse(content, file_path, handle_file)
+
+
 def insert_tags_in_text(text, tags, multiline):
     """Replicate TestRunner.insertTagsInText — insert tag markers into text."""
-    offsets_with_tags = set()
-    for tag in tags:
-        offsets_with_tags.add(tag.offset)
+    if not tags:
+        # Most lines carry no tags: only the indentation and rstrip apply
+        return (text.replace("\n", "\n  ") if multiline else text).rstrip()
+    tag_key = tuple((t.offset, t.closing, t.value) for t in tags)
+    return _insert_tags_cached(text, tag_key, multiline)
 
-    chars = list(text)
-    length = len(chars)
-    result = []
 
-    for i in range(length):
-        if i in offsets_with_tags:
-            for tag in tags:
-                if tag.offset == i:
-                    result.append("<<")
-                    if tag.closing:
-                        result.append("/")
-                    result.append(tag.value)
-                    result.append(">>")
-        c = chars[i]
-        if multiline and c == "\n":
-            result.append("\n  ")
-        else:
-            result.append(c)
+@lru_cache(maxsize=4096)
+def _insert_tags_cached(text, tag_key, multiline):
+    """Pure variant of insert_tags_in_text over ``(offset, closing, value)`` tuples.
+
+    Memoized since LF/CRLF and roundtrip runs emit the same lines.
+    """
+    length = len(text)
+
+    # Walk the in-range tags in offset order (the sort is stable, so tags
+    # sharing an offset keep their order), emitting the text between them
+    result = []
+    prev = 0
+    for offset, closing, value in sorted(
+        (t for t in tag_key if 0 <= t[0] < length), key=itemgetter(0)
+    ):
+        if offset != prev:
+            result.append(text[prev:offset])
+            prev = offset
+        result.append("<</" + value + ">>" if closing else "<<" + value + ">>")
+    result.append(text[prev:])
 
     # Tags at end of text
-    for tag in tags:
-        if tag.offset >= length:
-            result.append("<<")
-            if tag.closing:
-                result.append("/")
-            result.append(tag.value)
-            result.append(">>")
+    for offset, closing, value in tag_key:
+        if offset >= length:
+            result.append("<</" + value + ">>" if closing else "<<" + value + ">>")
 
-    return "".join(result).rstrip()
+    # Indent once over the whole line; tag markers never contain newlines
+    tagged = "".join(result)
+    if multiline:
+        tagged = tagged.replace("\n", "\n  ")
+    return tagged.rstrip()
+
+
+def diff_output(expected, actual):
+    """Compare output, return ``(index, expected_lines, actual_lines)``.
+
+    ``index`` is -1 if the outputs match (the line lists are then None),
+    or the line index of the first difference.
+    """
+    expected = to_lf(expected).strip()
+    actual = to_lf(actual).strip()
+    if expected == actual:
+        return -1, None, None
+
+    expected_lines = expected.split("\n")
+    actual_lines = actual.split("\n")
+    for i, (e, a) in enumerate(zip(expected_lines, actual_lines)):
+        if e != a:
+            return i, expected_lines, actual_lines
+    return min(len(expected_lines), len(actual_lines)), expected_lines, actual_lines
 
 
 def compare_output(expected, actual):
     """Compare output, return -1 if match or line index of first difference."""
-    expected_lines = expected.replace("\r\n", "\n").strip().split("\n")
-    actual_lines = actual.replace("\r\n", "\n").strip().split("\n")
-    min_len = min(len(expected_lines), len(actual_lines))
-    max_len = max(len(expected_lines), len(actual_lines))
-
-    for i in range(min_len):
-        if expected_lines[i] != actual_lines[i]:
-            return i
-    if min_len < max_len:
-        return min_len
-    return -1
+    return diff_output(expected, actual)[0]
 
 
 def parse_simple_yaml(text):
@@ -155,7 +234,7 @@ def parse_simple_yaml(text):
                 # Fall through to process this line normally
 
         # New list item
-        m = re.match(r"^- (\w+):\s*(.*)", stripped)
+        m = _YAML_ITEM_RE.match(stripped)
         if m:
             current = {}
             items.append(current)
@@ -171,7 +250,7 @@ def parse_simple_yaml(text):
             continue
 
         # Continuation key in current item
-        m2 = re.match(r"^  (\w+):\s*(.*)", stripped)
+        m2 = _YAML_CONT_RE.match(stripped)
         if m2 and current is not None:
             key = m2.group(1)
             value = m2.group(2)
@@ -202,7 +281,7 @@ def _parse_yaml_value(s):
             return []
         return [_parse_yaml_value(v.strip()) for v in inner.split(",")]
     # Integer
-    if re.match(r"^-?\d+$", s):
+    if _INT_RE.match(s):
         return int(s)
     # Boolean
     if s == "true":
@@ -219,12 +298,18 @@ def _parse_yaml_value(s):
 
 
 def extract_tests(content):
-    """Extract <test> YAML blocks from a .lor file."""
+    """Extract <test> YAML blocks from a .lor file.
+
+    Each item also gets a precomputed ``_choices_label`` for result lines.
+    """
     tests = []
-    for match in re.finditer(r"<test>([\s\S]*?)</test>", content):
+    for match in _TEST_BLOCK_RE.finditer(content):
         yaml_content = match.group(1).strip()
         parsed = parse_simple_yaml(yaml_content)
         if isinstance(parsed, list):
+            for item in parsed:
+                choices = item.get("choices")
+                item["_choices_label"] = " ~ [" + ",".join(map(str, choices)) + "]" if choices else ""
             tests.extend(parsed)
     return tests
 
@@ -232,13 +317,11 @@ def extract_tests(content):
 # ── Test runner ──────────────────────────────────────────────────────────
 
 def run_test(file_path, content, test_item, crlf):
-    """Run a single test case. Returns (passed, actual, expected, error)."""
-    # Normalize line endings
-    if crlf:
-        content = content.replace("\r\n", "\n").replace("\n", "\r\n")
-    else:
-        content = content.replace("\r\n", "\n")
+    """Run a single test case. Returns (passed, actual, expected, error).
 
+    ``content`` must already use the line endings of the mode (CRLF if
+    ``crlf`` is true, LF otherwise).
+    """
     choices = list(test_item.get("choices", []) or [])
     beat_name = test_item.get("beat") or None
     save_at_choice = test_item.get("saveAtChoice", -1)
@@ -248,14 +331,14 @@ def run_test(file_path, content, test_item, crlf):
     if save_at_dialogue is None:
         save_at_dialogue = -1
     expected = test_item["expected"]
-    output = [""]  # Use list for mutability in closures
+    output_parts = []  # Joined once when the result is produced
     choice_count = [0]
     dialogue_count = [0]
     parsed_script = [None]
     result = [None]  # (passed, actual, expected, error)
 
     # Parse the script up-front so loadLocale can walk its import tree
-    early_script = loreline_Loreline.parse(content, file_path, handle_file)
+    early_script = parse_cached(content, file_path)
 
     # Build options (translations loaded across the import tree)
     options = None
@@ -272,16 +355,12 @@ def run_test(file_path, content, test_item, crlf):
     restore_input = None
     if test_item.get("restoreFile"):
         restore_path = os.path.join(os.path.dirname(file_path), test_item["restoreFile"])
-        with open(restore_path, "r", encoding="utf-8") as f:
-            restore_input = f.read()
-        if crlf:
-            restore_input = restore_input.replace("\r\n", "\n").replace("\n", "\r\n")
-        else:
-            restore_input = restore_input.replace("\r\n", "\n")
+        restore_input = load_aux(restore_path, crlf)
 
     def on_finish(interp):
-        cmp = compare_output(expected, output[0])
-        result[0] = (cmp == -1, output[0], expected, None)
+        actual = "".join(output_parts)
+        cmp = compare_output(expected, actual)
+        result[0] = (cmp == -1, actual, expected, None)
 
     def on_dialogue(interp, character, text, tags, advance):
         multiline = "\n" in text
@@ -293,12 +372,12 @@ def run_test(file_path, content, test_item, crlf):
                 char_name = character
             tagged_text = insert_tags_in_text(text, tags, multiline)
             if multiline:
-                output[0] += char_name + ":\n  " + tagged_text + "\n\n"
+                output_parts.append(char_name + ":\n  " + tagged_text + "\n\n")
             else:
-                output[0] += char_name + ": " + tagged_text + "\n\n"
+                output_parts.append(char_name + ": " + tagged_text + "\n\n")
         else:
             tagged_text = insert_tags_in_text(text, tags, multiline)
-            output[0] += "~ " + tagged_text + "\n\n"
+            output_parts.append("~ " + tagged_text + "\n\n")
 
         # Save/restore test at dialogue
         if save_at_dialogue >= 0 and dialogue_count[0] == save_at_dialogue:
@@ -306,16 +385,14 @@ def run_test(file_path, content, test_item, crlf):
             save_data = interp.save()
 
             if restore_input is not None:
-                restore_script = loreline_Loreline.parse(
-                    restore_input, file_path, handle_file
-                )
+                restore_script = parse_cached(restore_input, file_path)
                 if restore_script:
                     loreline_Loreline.resume(
                         restore_script, on_dialogue, on_choice, on_finish,
                         save_data, None, options
                     )
                 else:
-                    result[0] = (False, output[0], expected, "Error parsing restoreInput script")
+                    result[0] = (False, "".join(output_parts), expected, "Error parsing restoreInput script")
             else:
                 loreline_Loreline.resume(
                     parsed_script[0], on_dialogue, on_choice, on_finish,
@@ -332,8 +409,8 @@ def run_test(file_path, content, test_item, crlf):
             multiline = "\n" in opt.text
             opt_tags = opt.tags if opt.tags is not None else []
             tagged_text = insert_tags_in_text(opt.text, opt_tags, multiline)
-            output[0] += prefix + " " + tagged_text + "\n"
-        output[0] += "\n"
+            output_parts.append(prefix + " " + tagged_text + "\n")
+        output_parts.append("\n")
 
         # Save/restore test
         if save_at_choice >= 0 and choice_count[0] == save_at_choice:
@@ -341,16 +418,14 @@ def run_test(file_path, content, test_item, crlf):
             save_data = interp.save()
 
             if restore_input is not None:
-                restore_script = loreline_Loreline.parse(
-                    restore_input, file_path, handle_file
-                )
+                restore_script = parse_cached(restore_input, file_path)
                 if restore_script:
                     loreline_Loreline.resume(
                         restore_script, on_dialogue, on_choice, on_finish,
                         save_data, None, options
                     )
                 else:
-                    result[0] = (False, output[0], expected, "Error parsing restoreInput script")
+                    result[0] = (False, "".join(output_parts), expected, "Error parsing restoreInput script")
             else:
                 loreline_Loreline.resume(
                     parsed_script[0], on_dialogue, on_choice, on_finish,
@@ -374,209 +449,256 @@ def run_test(file_path, content, test_item, crlf):
                 script, on_dialogue, on_choice, on_finish, beat_name, options
             )
         else:
-            result[0] = (False, output[0], expected, "Error parsing script")
+            result[0] = (False, "".join(output_parts), expected, "Error parsing script")
     except Exception as e:
-        result[0] = (False, output[0], expected, str(e))
+        result[0] = (False, "".join(output_parts), expected, str(e))
 
     if result[0] is None:
-        result[0] = (False, output[0], expected, "Test did not produce a result")
+        result[0] = (False, "".join(output_parts), expected, "Test did not produce a result")
 
     return result[0]
 
 
-# ── Main ─────────────────────────────────────────────────────────────────
+def run_file(file_path):
+    """Run every test of a file.
 
-def main():
-    global pass_count, fail_count, file_count, file_fail_count
+    Returns ``(pass_count, fail_count, output)``, or None if the file has
+    no tests. Output is collected rather than written so files can run in
+    worker processes and still be reported in order.
+    """
+    pass_count = 0
+    fail_count = 0
+    out = []
+    write = out.append
 
-    if len(sys.argv) < 2:
-        print("Usage: python3 py/test-runner.py <test-directory>", file=sys.stderr)
-        sys.exit(1)
+    # Normalized first, as text-mode reads used to, so test blocks parse the same
+    content_lf = to_lf(read_file(file_path))
 
-    test_dir = sys.argv[1]
+    test_items = extract_tests(content_lf)
+    if not test_items:
+        return None
 
-    # Test fixtures exercise every supported translation format.
-    loreline_Loreline.translationFormat("po", True)
-    loreline_Loreline.translationFormat("xliff", True)
-    loreline_Loreline.translationFormat("csv", True)
+    # Content normalized for each mode, keyed by crlf
+    contents = {False: content_lf, True: to_crlf(content_lf)}
 
-    test_files = collect_test_files(test_dir)
+    # Whether every test item passed in each mode, keyed by crlf
+    mode_passed = {False: True, True: True}
 
-    if not test_files:
-        print("No test files found in", test_dir, file=sys.stderr)
-        sys.exit(1)
+    for item in test_items:
+        for crlf in (False, True):
+            mode_label = "CRLF" if crlf else "LF"
+            label = f"{file_path} ~ {mode_label}{item['_choices_label']}"
 
-    for file_path in test_files:
-        with open(file_path, "r", encoding="utf-8") as f:
-            raw_content = f.read()
+            passed, actual, expected, error = run_test(file_path, contents[crlf], item, crlf)
 
-        test_items = extract_tests(raw_content)
-        if not test_items:
-            continue
+            if passed:
+                pass_count += 1
+                write(_PASS + label + _END)
+            else:
+                fail_count += 1
+                mode_passed[crlf] = False
+                buf = [_FAIL, label, _END]
+                if error:
+                    buf.append(f"  Error: {error}\n")
+
+                # Show diff
+                i, expected_lines, actual_lines = diff_output(expected, actual)
+                if i != -1:
+                    buf.append(f"  > Unexpected output at line {i + 1}\n")
+                    buf.append(f"  >  got: {actual_lines[i] if i < len(actual_lines) else '(empty)'}\n")
+                    buf.append(f"  > need: {expected_lines[i] if i < len(expected_lines) else '(empty)'}\n")
+                write("".join(buf))
+
+    # Roundtrip tests for each mode
+    for crlf in (False, True):
+        mode_label = "CRLF" if crlf else "LF"
+        label = f"{file_path} ~ {mode_label} ~ roundtrip"
+        newline = "\r\n" if crlf else "\n"
+
+        try:
+            content = contents[crlf]
+
+            # Parse original
+            script1 = parse_cached(content, file_path)
+            if not script1:
+                fail_count += 1
+                write(_FAIL + label + _END + "  Error: Failed to parse original script\n")
+                continue
 
-        file_count += 1
-        fail_before = fail_count
+            # Structural check: print -> parse -> print must be stable
+            print1 = loreline_Loreline.print(script1, "  ", newline)
+            script2 = parse_cached(print1, file_path)
+            if not script2:
+                fail_count += 1
+                write(_FAIL + label + _END + "  Error: Failed to parse printed script\n")
+                continue
+            print2 = loreline_Loreline.print(script2, "  ", newline)
 
-        for item in test_items:
-            for crlf in (False, True):
-                mode_label = "CRLF" if crlf else "LF"
-                choices_label = ""
-                if item.get("choices"):
-                    choices_label = " ~ [" + ",".join(str(c) for c in item["choices"]) + "]"
-                label = f"{file_path} ~ {mode_label}{choices_label}"
+            if print1 != print2:
+                fail_count += 1
+                buf = [_FAIL, label, _END]
+                lines1 = to_lf(print1).split("\n")
+                lines2 = to_lf(print2).split("\n")
+                ml = min(len(lines1), len(lines2))
+                for i in range(ml):
+                    if lines1[i] != lines2[i]:
+                        buf.append(f"  > Printer output not idempotent at line {i + 1}\n")
+                        buf.append(f"  >  print1: {lines1[i]}\n")
+                        buf.append(f"  >  print2: {lines2[i]}\n")
+                        break
+                if len(lines1) != len(lines2):
+                    buf.append(f"  > Line count differs: print1={len(lines1)}, print2={len(lines2)}\n")
+                write("".join(buf))
+                continue
 
-                passed, actual, expected, error = run_test(file_path, raw_content, item, crlf)
+            # Printing gave back the exact input: the behavioral check
+            # would replay the same content, which already passed above
+            if print1 == content and mode_passed[crlf]:
+                pass_count += 1
+                write(_PASS + label + _END)
+                continue
 
-                if passed:
-                    pass_count += 1
-                    print(f"\033[1m\033[32mPASS\033[0m - \033[90m{label}\033[0m")
-                else:
-                    fail_count += 1
-                    print(f"\033[1m\033[31mFAIL\033[0m - \033[90m{label}\033[0m")
-                    if error:
-                        print(f"  Error: {error}")
-
-                    # Show diff
-                    expected_lines = expected.replace("\r\n", "\n").strip().split("\n")
-                    actual_lines = actual.replace("\r\n", "\n").strip().split("\n")
-                    min_len = min(len(expected_lines), len(actual_lines))
-
-                    shown = False
-                    for i in range(min_len):
-                        if expected_lines[i] != actual_lines[i]:
-                            print(f"  > Unexpected output at line {i + 1}")
-                            print(f"  >  got: {actual_lines[i]}")
-                            print(f"  > need: {expected_lines[i]}")
-                            shown = True
-                            break
-                    if not shown and min_len < max(len(expected_lines), len(actual_lines)):
-                        if min_len < len(actual_lines):
-                            print(f"  > Unexpected output at line {min_len + 1}")
-                            print(f"  >  got: {actual_lines[min_len]}")
-                            print(f"  > need: (empty)")
-                        else:
-                            print(f"  > Unexpected output at line {min_len + 1}")
-                            print(f"  >  got: (empty)")
-                            print(f"  > need: {expected_lines[min_len]}")
-
-        # Roundtrip tests for each mode
-        for crlf in (False, True):
-            mode_label = "CRLF" if crlf else "LF"
-            label = f"{file_path} ~ {mode_label} ~ roundtrip"
-            newline = "\r\n" if crlf else "\n"
+            # Behavioral check: run each test item on the printed content
+            all_passed = True
+            first_error = None
+            first_expected = None
+            first_actual = None
 
-            try:
-                # Normalize content for this mode
-                content = raw_content.replace("\r\n", "\n")
-                if crlf:
-                    content = content.replace("\n", "\r\n")
-
-                # Parse original
-                script1 = loreline_Loreline.parse(content, file_path, handle_file)
-                if not script1:
-                    fail_count += 1
-                    print(f"\033[1m\033[31mFAIL\033[0m - \033[90m{label}\033[0m")
-                    print("  Error: Failed to parse original script")
-                    continue
-
-                # Structural check: print -> parse -> print must be stable
-                print1 = loreline_Loreline.print(script1, "  ", newline)
-                script2 = loreline_Loreline.parse(print1, file_path, handle_file)
-                if not script2:
-                    fail_count += 1
-                    print(f"\033[1m\033[31mFAIL\033[0m - \033[90m{label}\033[0m")
-                    print("  Error: Failed to parse printed script")
-                    continue
-                print2 = loreline_Loreline.print(script2, "  ", newline)
+            for item in test_items:
+                passed, actual, expected_str, error = run_test(
+                    file_path, print1, item, crlf
+                )
+                if not passed:
+                    all_passed = False
+                    if first_error is None:
+                        first_error = error
+                        first_expected = expected_str
+                        first_actual = actual
+
+            if all_passed:
+                pass_count += 1
+                write(_PASS + label + _END)
+            else:
+                fail_count += 1
+                buf = [_FAIL, label, _END]
+                if first_error:
+                    buf.append(f"  Error: {first_error}\n")
+                if first_expected and first_actual:
+                    i, el, al = diff_output(first_expected, first_actual)
+                    if i != -1 and i < min(len(el), len(al)):
+                        buf.append(f"  > Unexpected output at line {i + 1}\n")
+                        buf.append(f"  >  got: {al[i]}\n")
+                        buf.append(f"  > need: {el[i]}\n")
+                write("".join(buf))
+
+        except Exception as e:
+            fail_count += 1
+            write(f"{_FAIL}{label}{_END}  Error: {e}\n")
+
+    # JSON roundtrip test
+    for crlf in [False, True]:
+        mode_label = "CRLF" if crlf else "LF"
+        json_label = f"{file_path} ~ {mode_label} ~ json-roundtrip"
+        try:
+            content = contents[crlf]
+            script = parse_cached(content, file_path)
+            if not script:
+                fail_count += 1
+                write(_FAIL + json_label + _END + "  Error: Failed to parse script\n")
+            else:
+                json1 = loreline_Json.stringify(script.toJson(), False)
+                script2 = loreline_Script.fromJson(loreline_Json.parse(json1))
+                json2 = loreline_Json.stringify(script2.toJson(), False)
 
-                if print1 != print2:
-                    fail_count += 1
-                    print(f"\033[1m\033[31mFAIL\033[0m - \033[90m{label}\033[0m")
-                    lines1 = print1.replace("\r\n", "\n").split("\n")
-                    lines2 = print2.replace("\r\n", "\n").split("\n")
-                    ml = min(len(lines1), len(lines2))
-                    for i in range(ml):
-                        if lines1[i] != lines2[i]:
-                            print(f"  > Printer output not idempotent at line {i + 1}")
-                            print(f"  >  print1: {lines1[i]}")
-                            print(f"  >  print2: {lines2[i]}")
-                            break
-                    if len(lines1) != len(lines2):
-                        print(f"  > Line count differs: print1={len(lines1)}, print2={len(lines2)}")
-                    continue
-
-                # Behavioral check: run each test item on the printed content
-                all_passed = True
-                first_error = None
-                first_expected = None
-                first_actual = None
-
-                for item in test_items:
-                    passed, actual, expected_str, error = run_test(
-                        file_path, print1, item, crlf
-                    )
-                    if not passed:
-                        all_passed = False
-                        if first_error is None:
-                            first_error = error
-                            first_expected = expected_str
-                            first_actual = actual
-
-                if all_passed:
+                if json1 == json2:
                     pass_count += 1
-                    print(f"\033[1m\033[32mPASS\033[0m - \033[90m{label}\033[0m")
+                    write(_PASS + json_label + _END)
                 else:
                     fail_count += 1
-                    print(f"\033[1m\033[31mFAIL\033[0m - \033[90m{label}\033[0m")
-                    if first_error:
-                        print(f"  Error: {first_error}")
-                    if first_expected and first_actual:
-                        el = first_expected.replace("\r\n", "\n").strip().split("\n")
-                        al = first_actual.replace("\r\n", "\n").strip().split("\n")
-                        ml = min(len(el), len(al))
-                        for i in range(ml):
-                            if el[i] != al[i]:
-                                print(f"  > Unexpected output at line {i + 1}")
-                                print(f"  >  got: {al[i]}")
-                                print(f"  > need: {el[i]}")
-                                break
-
-            except Exception as e:
-                fail_count += 1
-                print(f"\033[1m\033[31mFAIL\033[0m - \033[90m{label}\033[0m")
-                print(f"  Error: {e}")
+                    write(_FAIL + json_label + _END + "  > JSON mismatch after roundtrip\n")
+        except Exception as e:
+            fail_count += 1
+            write(f"{_FAIL}{json_label}{_END}  Error: {e}\n")
 
-        # JSON roundtrip test
-        for crlf in [False, True]:
-            mode_label = "CRLF" if crlf else "LF"
-            json_label = f"{file_path} ~ {mode_label} ~ json-roundtrip"
+    return pass_count, fail_count, "".join(out)
+
+
+def enable_translation_formats():
+    """Enable every translation format (test fixtures exercise all of them)."""
+    loreline_Loreline.translationFormat("po", True)
+    loreline_Loreline.translationFormat("xliff", True)
+    loreline_Loreline.translationFormat("csv", True)
+
+
+def run_files(files, jobs):
+    """Run test files, yielding run_file() results in order.
+
+    With more than one job, files run in worker processes: they are
+    submitted as they are drawn from ``files``, keeping only a few per
+    worker in flight, so a lazy walk is not exhausted up front. With one
+    job, files run inline, which keeps pdb and tracebacks usable.
+    """
+    if jobs <= 1:
+        enable_translation_formats()
+        for file_path in files:
+            yield run_file(file_path)
+        return
+
+    window = 4 * jobs
+    with ProcessPoolExecutor(max_workers=jobs, initializer=enable_translation_formats) as executor:
+        pending = deque()
+        for file_path in files:
+            pending.append(executor.submit(run_file, file_path))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+# ── Main ─────────────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(prog="python3 py/test-runner.py")
+    parser.add_argument("test_dir", metavar="test-directory")
+    # Parallel by default; -j 1 (or LORELINE_TEST_JOBS=1) runs serially
+    parser.add_argument("-j", "--jobs", type=int, help="number of worker processes (default: one per CPU)")
+    args = parser.parse_args()
+
+    jobs = args.jobs
+    if jobs is None:
+        env_jobs = os.environ.get("LORELINE_TEST_JOBS")
+        if env_jobs:
             try:
-                content = raw_content.replace("\r\n", "\n")
-                if crlf:
-                    content = content.replace("\n", "\r\n")
-                script = loreline_Loreline.parse(content, file_path, handle_file)
-                if not script:
-                    fail_count += 1
-                    print(f"\033[1m\033[31mFAIL\033[0m - \033[90m{json_label}\033[0m")
-                    print("  Error: Failed to parse script")
-                else:
-                    json1 = loreline_Json.stringify(script.toJson(), False)
-                    script2 = loreline_Script.fromJson(loreline_Json.parse(json1))
-                    json2 = loreline_Json.stringify(script2.toJson(), False)
-
-                    if json1 == json2:
-                        pass_count += 1
-                        print(f"\033[1m\033[32mPASS\033[0m - \033[90m{json_label}\033[0m")
-                    else:
-                        fail_count += 1
-                        print(f"\033[1m\033[31mFAIL\033[0m - \033[90m{json_label}\033[0m")
-                        print("  > JSON mismatch after roundtrip")
-            except Exception as e:
-                fail_count += 1
-                print(f"\033[1m\033[31mFAIL\033[0m - \033[90m{json_label}\033[0m")
-                print(f"  Error: {e}")
+                jobs = int(env_jobs)
+            except ValueError:
+                parser.error(f"LORELINE_TEST_JOBS must be an integer, got {env_jobs!r}")
+        else:
+            jobs = os.cpu_count() or 1
+
+    test_dir = args.test_dir
+
+    test_files = iter_test_files(test_dir)
+    first_file = next(test_files, None)
 
-        if fail_count > fail_before:
+    if first_file is None:
+        print("No test files found in", test_dir, file=sys.stderr)
+        sys.exit(1)
+
+    pass_count = 0
+    fail_count = 0
+    file_count = 0
+    file_fail_count = 0
+
+    files = itertools.chain((first_file,), test_files)
+    for result in run_files(files, jobs):
+        if result is None:
+            continue
+        passed, failed, output = result
+        sys.stdout.write(output)
+        pass_count += passed
+        fail_count += failed
+        file_count += 1
+        if failed:
             file_fail_count += 1
 
     total = pass_count + fail_count
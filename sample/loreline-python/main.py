@@ -13,6 +13,9 @@ import sys
 
 from loreline import Loreline, Script, Interpreter, ChoiceOption
 
+# Line break followed by the indent of multiline dialogue continuation lines
+CONTINUATION = "\n "
+
 
 def read_file(path: str) -> str:
     """Read a file and return its contents, or empty string on error."""
@@ -32,7 +35,7 @@ def handle_file(path: str, provide):
 def handle_dialogue(interp: Interpreter, character, text: str, tags, advance):
     """Display dialogue or narrative text."""
     # Indent continuation lines for multiline text
-    formatted = text.replace("\n", "\n ")
+    formatted = text.replace("\n", CONTINUATION)
 
     if character is not None:
         # Dialogue — resolve display name